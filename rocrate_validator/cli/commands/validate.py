@@ -15,21 +15,22 @@
 from __future__ import annotations
 
 import os
+import queue
 import sys
+import textwrap
+import threading
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from InquirerPy import prompt
-from InquirerPy.base.control import Choice
 from rich.align import Align
 from rich.layout import Layout
-from rich.live import Live
 from rich.markdown import Markdown
 from rich.padding import Padding
-from rich.pager import Pager
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 from rich.rule import Rule
+from rich.text import Text
 
 import rocrate_validator.log as logging
 from rocrate_validator import services
@@ -44,6 +45,10 @@ from rocrate_validator.models import (LevelCollection, Profile, Severity,
 from rocrate_validator.utils import (URI, get_profiles_path,
                                      validate_rocrate_uri)
 
+if TYPE_CHECKING:
+    from rich.pager import Pager
+    from rich.progress import Progress
+
 # from rich.markdown import Markdown
 # from rich.table import Table
 
@@ -53,6 +58,10 @@ DEFAULT_PROFILES_PATH = get_profiles_path()
 # set up logging
 logger = logging.getLogger(__name__)
 
+# map the severity names to the corresponding severities
+_SEVERITY_BY_NAME = {s.name: s for s in Severity}
+_SEVERITY_CHOICES = tuple(_SEVERITY_BY_NAME)
+
 
 def validate_uri(ctx, param, value):
     """
@@ -68,49 +77,29 @@ def validate_uri(ctx, param, value):
     return value
 
 
-def __get_single_char_win32__(console: Optional[Console] = None, end: str = "\n",
-                              message: Optional[str] = None,
-                              choices: Optional[list[str]] = None) -> str:
+@lru_cache(maxsize=4096)
+def __get_markdown__(text: str) -> Markdown:
     """
-    Get a single character from the console
+    Get the (cached) Markdown renderable of the given text
     """
-    import msvcrt
-
-    char = None
-    while char is None or (choices and char not in choices):
-        if console and message:
-            console.print(f"\n{message}", end="")
-        try:
-            char = msvcrt.getch().decode()
-        finally:
-            if console:
-                console.print(char, end=end if choices and char in choices else "")
-        if choices and char not in choices:
-            if console:
-                console.print(" [bold red]INVALID CHOICE[/bold red]", end=end)
-    return char
+    return Markdown(text)
 
 
-def __get_single_char_unix__(console: Optional[Console] = None, end: str = "\n",
-                             message: Optional[str] = None,
-                             choices: Optional[list[str]] = None) -> str:
+def get_single_char(console: Optional[Console] = None, end: str = "\n",
+                    message: Optional[str] = None,
+                    choices: Optional[list[str]] = None) -> str:
     """
     Get a single character from the console
     """
-    import termios
-    import tty
-
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
     char = None
     while char is None or (choices and char not in choices):
         if console and message:
             console.print(f"\n{message}", end="")
         try:
-            tty.setraw(sys.stdin.fileno())
-            char = sys.stdin.read(1)
+            # click takes care of switching the terminal to raw mode
+            # (or of using msvcrt on Windows) only for the single read
+            char = click.getchar(echo=False)
         finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
             if console:
                 console.print(char, end=end if choices and char in choices else "")
         if choices and char not in choices:
@@ -119,17 +108,6 @@ def __get_single_char_unix__(console: Optional[Console] = None, end: str = "\n",
     return char
 
 
-def get_single_char(console: Optional[Console] = None, end: str = "\n",
-                    message: Optional[str] = None,
-                    choices: Optional[list[str]] = None) -> str:
-    """
-    Get a single character from the console
-    """
-    if sys.platform == "win32":
-        return __get_single_char_win32__(console, end, message, choices)
-    return __get_single_char_unix__(console, end, message, choices)
-
-
 @cli.command("validate")
 @click.argument("rocrate-uri", callback=validate_uri, default=".")
 @click.option(
@@ -175,7 +153,7 @@ def get_single_char(console: Optional[Console] = None, end: str = "\n",
 @click.option(
     "-l",
     "--requirement-severity",
-    type=click.Choice([s.name for s in Severity], case_sensitive=False),
+    type=click.Choice(_SEVERITY_CHOICES, case_sensitive=False),
     default=Severity.REQUIRED.name,
     show_default=True,
     help="Severity of the requirements to validate",
@@ -256,20 +234,21 @@ def validate(ctx,
     if not interactive or sys.platform == "win32":
         enable_pager = False
     # Log the input parameters for debugging
-    logger.debug("profiles_path: %s", os.path.abspath(profiles_path))
-    logger.debug("profile_identifier: %s", profile_identifier)
-    logger.debug("requirement_severity: %s", requirement_severity)
-    logger.debug("requirement_severity_only: %s", requirement_severity_only)
-
-    logger.debug("disable_inheritance: %s", disable_profile_inheritance)
-    logger.debug("rocrate_uri: %s", rocrate_uri)
-    logger.debug("no_fail_fast: %s", no_fail_fast)
-    logger.debug("fail fast: %s", not no_fail_fast)
-
-    if ontologies_path:
-        logger.debug("ontologies_path: %s", os.path.abspath(ontologies_path))
-    if rocrate_uri:
-        logger.debug("rocrate_path: %s", os.path.abspath(rocrate_uri))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("profiles_path: %s", os.path.abspath(profiles_path))
+        logger.debug("profile_identifier: %s", profile_identifier)
+        logger.debug("requirement_severity: %s", requirement_severity)
+        logger.debug("requirement_severity_only: %s", requirement_severity_only)
+
+        logger.debug("disable_inheritance: %s", disable_profile_inheritance)
+        logger.debug("rocrate_uri: %s", rocrate_uri)
+        logger.debug("no_fail_fast: %s", no_fail_fast)
+        logger.debug("fail fast: %s", not no_fail_fast)
+
+        if ontologies_path:
+            logger.debug("ontologies_path: %s", os.path.abspath(ontologies_path))
+        if rocrate_uri:
+            logger.debug("rocrate_path: %s", os.path.abspath(rocrate_uri))
 
     try:
         # Validation settings
@@ -290,7 +269,9 @@ def validate(ctx,
             console.print(get_app_header_rule())
 
         # Get the available profiles
-        available_profiles = services.get_profiles(profiles_path)
+        # (loaded once and reused to compute the statistics of the selected profiles)
+        available_profiles = services.get_profiles(profiles_path,
+                                                   severity=_SEVERITY_BY_NAME[requirement_severity.upper()])
 
         # Detect the profile to use for validation
         autodetection = False
@@ -300,7 +281,8 @@ def validate(ctx,
             # Auto-detect the profile to use for validation (if not disabled)
             candidate_profiles = None
             if not no_auto_profile:
-                candidate_profiles = services.detect_profiles(settings=validation_settings)
+                candidate_profiles = services.detect_profiles(settings=validation_settings,
+                                                              profiles=available_profiles)
                 logger.debug("Candidate profiles: %s", candidate_profiles)
             else:
                 logger.info("Auto-detection of the profiles to use for validation is disabled")
@@ -355,7 +337,7 @@ def validate(ctx,
             logger.debug("Profile autodetected: %s", autodetection)
 
             # Compute the profile statistics
-            profile_stats = __compute_profile_stats__(validation_settings)
+            profile_stats = __compute_profile_stats__(validation_settings, available_profiles)
 
             report_layout = ValidationReportLayout(console, validation_settings, profile_stats, None)
 
@@ -397,15 +379,12 @@ def validate(ctx,
             if output_file:
                 # Print the validation report to a file
                 if output_format == "json":
-                    with open(output_file, "w") as f:
-                        f.write(result.to_json())
+                    result.write_json(output_file)
                 elif output_format == "text":
+                    # write a plain text report: rendering the Rich layout is only needed on the terminal
                     with open(output_file, "w") as f:
-                        c = Console(file=f, color_system=None, width=output_line_width, height=31)
-                        c.print(report_layout.layout)
-                        report_layout.console = c
-                        if not result.passed() and verbose:
-                            report_layout.show_validation_details(None, enable_pager=False)
+                        report_layout.write_text_report(f, width=output_line_width,
+                                                        with_details=not result.passed() and verbose)
 
             # Interrupt the validation if the fail fast mode is enabled
             if no_fail_fast and not is_valid:
@@ -423,6 +402,10 @@ def multiple_choice(console: Console,
     """
     Display a multiple choice menu
     """
+    # InquirerPy (and prompt_toolkit) are only needed by the interactive menu
+    from InquirerPy import prompt
+    from InquirerPy.base.control import Choice
+
     # Build the prompt text
     prompt_text = "Please select the profiles to validate the RO-Crate against (<SPACE> to select):"
 
@@ -452,6 +435,9 @@ class ProgressMonitor(Subscriber):
     REQUIREMENT_CHECK_VALIDATION = "Requirements Checks"
 
     def __init__(self, layout: ValidationReportLayout, stats: dict):
+        from rich.progress import (BarColumn, Progress, TextColumn,
+                                   TimeElapsedColumn)
+
         self.__progress = Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
@@ -466,6 +452,17 @@ class ProgressMonitor(Subscriber):
         self.requirement_check_validation = self.progress.add_task(
             self.REQUIREMENT_CHECK_VALIDATION, total=stats.get("total_checks"))
         self.__layout = layout
+        # events notified by the validation thread,
+        # processed by the rendering thread through `process_events`
+        self.__events = queue.SimpleQueue()
+        # map the relevant event types to their handlers:
+        # the other events (e.g., *_START) do not affect the progress
+        self.__handlers = {
+            EventType.REQUIREMENT_CHECK_VALIDATION_END: self.__on_requirement_check_validation_end__,
+            EventType.REQUIREMENT_VALIDATION_END: self.__on_requirement_validation_end__,
+            EventType.PROFILE_VALIDATION_END: self.__on_profile_validation_end__,
+            EventType.VALIDATION_END: self.__on_validation_end__,
+        }
         super().__init__("ProgressMonitor")
 
     def start(self):
@@ -483,38 +480,55 @@ class ProgressMonitor(Subscriber):
         return self.__progress
 
     def update(self, event: Event):
-        # logger.debug("Event: %s", event.event_type)
-        if event.event_type == EventType.PROFILE_VALIDATION_START:
-            logger.debug("Profile validation start: %s", event.profile.identifier)
-        elif event.event_type == EventType.REQUIREMENT_VALIDATION_START:
-            logger.debug("Requirement validation start")
-        elif event.event_type == EventType.REQUIREMENT_CHECK_VALIDATION_START:
-            logger.debug("Requirement check validation start")
-        elif event.event_type == EventType.REQUIREMENT_CHECK_VALIDATION_END:
-            if not event.requirement_check.requirement.hidden:
-                self.progress.update(task_id=self.requirement_check_validation, advance=1)
-                if event.validation_result is not None:
-                    if event.validation_result:
-                        self._stats["passed_checks"].append(event.requirement_check)
-                    else:
-                        self._stats["failed_checks"].append(event.requirement_check)
-                    self.layout.update(self._stats)
-        elif event.event_type == EventType.REQUIREMENT_VALIDATION_END:
-            if not event.requirement.hidden:
-                self.progress.update(task_id=self.requirement_validation, advance=1)
-                if event.validation_result:
-                    self._stats["passed_requirements"].append(event.requirement)
+        # only enqueue the relevant events: the rendering state is updated by `process_events`
+        if event.event_type in self.__handlers:
+            self.__events.put(event)
+
+    def process_events(self):
+        """
+        Process the pending events and update the report layout (once) accordingly
+        """
+        processed = False
+        while True:
+            try:
+                event = self.__events.get_nowait()
+            except queue.Empty:
+                break
+            self.__handlers[event.event_type](event)
+            processed = True
+        if processed:
+            self.layout.update(self._stats)
+
+    def __on_requirement_check_validation_end__(self, event: Event):
+        if not event.requirement_check.requirement.hidden:
+            self.progress.update(task_id=self.requirement_check_validation, advance=1)
+            validation_result = event.validation_result
+            if validation_result is not None:
+                if validation_result:
+                    self._stats["passed_checks_count"] += 1
                 else:
-                    self._stats["failed_requirements"].append(event.requirement)
-                self.layout.update(self._stats)
-        elif event.event_type == EventType.PROFILE_VALIDATION_END:
-            self.progress.update(task_id=self.profile_validation, advance=1)
-        elif event.event_type == EventType.VALIDATION_END:
-            self.layout.set_overall_result(event.validation_result)
+                    self._stats["failed_checks_count"] += 1
+
+    def __on_requirement_validation_end__(self, event: Event):
+        if not event.requirement.hidden:
+            self.progress.update(task_id=self.requirement_validation, advance=1)
+            if event.validation_result:
+                self._stats["passed_requirements_count"] += 1
+            else:
+                self._stats["failed_requirements_count"] += 1
+
+    def __on_profile_validation_end__(self, event: Event):
+        self.progress.update(task_id=self.profile_validation, advance=1)
+
+    def __on_validation_end__(self, event: Event):
+        self.layout.set_overall_result(event.validation_result)
 
 
 class ValidationReportLayout(Layout):
 
+    # interval (in seconds) between two refreshes of the live rendering
+    REFRESH_INTERVAL = 0.1
+
     def __init__(self, console: Console, validation_settings: dict, profile_stats: dict, result: ValidationResult):
         super().__init__()
         self.console = console
@@ -528,6 +542,7 @@ class ValidationReportLayout(Layout):
         self.passed_checks = None
         self.failed_checks = None
         self.report_details_container = None
+        self.__counters: Optional[dict[str, Text]] = None
 
     @property
     def layout(self):
@@ -547,12 +562,45 @@ class ValidationReportLayout(Layout):
 
     def live(self, update_callable: callable) -> any:
         assert update_callable, "Update callable must be provided"
+        from rich.live import Live
+
+        # Run the update callable in a daemon worker thread
+        # (so that an interrupt of this thread is not delayed until the validation ends)
+        # while this thread processes its events and drives the rendering
+        outcome = queue.SimpleQueue()
+
+        def __run__():
+            try:
+                outcome.put((True, update_callable()))
+            except BaseException as e:
+                outcome.put((False, e))
+
         # Start live rendering
-        result = None
-        with Live(self.layout, console=self.console, refresh_per_second=10, transient=False):
-            result = update_callable()
+        with Live(self.layout, console=self.console, transient=False, auto_refresh=False) as live:
+            threading.Thread(target=__run__, name="Validation", daemon=True).start()
+            while True:
+                try:
+                    succeeded, result = outcome.get(timeout=self.REFRESH_INTERVAL)
+                    break
+                except queue.Empty:
+                    self.progress_monitor.process_events()
+                    live.refresh()
+            # process the events notified after the last refresh
+            self.progress_monitor.process_events()
+        if not succeeded:
+            raise result
         return result
 
+    @staticmethod
+    def __build_counter_panel__(counter: Text, title: str, border_style: str) -> Panel:
+        return Panel(
+            Align(counter, align="center"),
+            padding=(1, 1),
+            title=title,
+            title_align="center",
+            border_style=border_style
+        )
+
     def __init_layout__(self):
 
         # Get the validation settings
@@ -562,7 +610,7 @@ class ValidationReportLayout(Layout):
         self.console.height = 31
 
         # Create the layout of the base info of the validation report
-        severity_color = get_severity_color(Severity.get(settings["requirement_severity"]))
+        severity_color = get_severity_color(_SEVERITY_BY_NAME[settings["requirement_severity"].upper()])
         base_info_layout = Layout(
             Align(
                 f"\n[bold cyan]RO-Crate:[/bold cyan] [bold]{URI(settings['data_path']).uri}[/bold]"
@@ -573,9 +621,13 @@ class ValidationReportLayout(Layout):
                 f"[bold {severity_color}]{settings['requirement_severity']}[/bold {severity_color}]",
                 style="white", align="left"),
             name="Base Info", size=5)
+        # Create the counters of the checks, updated in place during the validation
+        self.__counters = {name: Text("0") for name in ("required", "recommended", "optional", "passed", "failed")}
         #
-        self.passed_checks = Layout(name="PASSED")
-        self.failed_checks = Layout(name="FAILED")
+        self.passed_checks = Layout(
+            self.__build_counter_panel__(self.__counters["passed"], "PASSED Checks", "green"), name="PASSED")
+        self.failed_checks = Layout(
+            self.__build_counter_panel__(self.__counters["failed"], "FAILED Checks", "red"), name="FAILED")
         # Create the layout of the requirement checks section
         validated_checks_container = Layout(name="Requirement Checks Validated")
         validated_checks_container.split_row(
@@ -586,9 +638,12 @@ class ValidationReportLayout(Layout):
         # Create the layout of the requirement checks section
         self.requirement_checks_by_severity_container_layout = Layout(name="Requirement Checks Validation", size=5)
         self.requirement_checks_by_severity_container_layout.split_row(
-            Layout(name="required"),
-            Layout(name="recommended"),
-            Layout(name="optional")
+            Layout(self.__build_counter_panel__(self.__counters["required"], "Severity: REQUIRED", "RED"),
+                   name="required"),
+            Layout(self.__build_counter_panel__(self.__counters["recommended"], "Severity: RECOMMENDED", "orange1"),
+                   name="recommended"),
+            Layout(self.__build_counter_panel__(self.__counters["optional"], "Severity: OPTIONAL", "yellow"),
+                   name="optional")
         )
 
         # Create the layout of the requirement checks section
@@ -634,68 +689,16 @@ class ValidationReportLayout(Layout):
     def update(self, profile_stats: dict = None):
         assert profile_stats, "Profile stats must be provided"
         self.profile_stats = profile_stats
-        self.requirement_checks_by_severity_container_layout["required"].update(
-            Panel(
-                Align(
-                    str(profile_stats['check_count_by_severity'][Severity.REQUIRED]) if profile_stats else "0",
-                    align="center"
-                ),
-                padding=(1, 1),
-                title="Severity: REQUIRED",
-                title_align="center",
-                border_style="RED"
-            )
-        )
-        self.requirement_checks_by_severity_container_layout["recommended"].update(
-            Panel(
-                Align(
-                    str(profile_stats['check_count_by_severity'][Severity.RECOMMENDED]) if profile_stats else "0",
-                    align="center"
-                ),
-                padding=(1, 1),
-                title="Severity: RECOMMENDED",
-                title_align="center",
-                border_style="orange1"
-            )
-        )
-        self.requirement_checks_by_severity_container_layout["optional"].update(
-            Panel(
-                Align(
-                    str(profile_stats['check_count_by_severity'][Severity.OPTIONAL]) if profile_stats else "0",
-                    align="center"
-                ),
-                padding=(1, 1),
-                title="Severity: OPTIONAL",
-                title_align="center",
-                border_style="yellow"
-            )
-        )
-
-        self.passed_checks.update(
-            Panel(
-                Align(
-                    str(len(self.profile_stats["passed_checks"])),
-                    align="center"
-                ),
-                padding=(1, 1),
-                title="PASSED Checks",
-                title_align="center",
-                border_style="green"
-            )
-        )
-
-        self.failed_checks.update(
-            Panel(
-                Align(
-                    str(len(self.profile_stats["failed_checks"])),
-                    align="center"
-                ),
-                padding=(1, 1),
-                title="FAILED Checks",
-                title_align="center",
-                border_style="red"
-            )
-        )
+        # only the counters are updated:
+        # the panels wrapping them are built once by `__init_layout__`
+        if self.__counters is None:
+            return
+        check_count_by_severity = profile_stats['check_count_by_severity']
+        self.__counters["required"].plain = str(check_count_by_severity[Severity.REQUIRED])
+        self.__counters["recommended"].plain = str(check_count_by_severity[Severity.RECOMMENDED])
+        self.__counters["optional"].plain = str(check_count_by_severity[Severity.OPTIONAL])
+        self.__counters["passed"].plain = str(profile_stats["passed_checks_count"])
+        self.__counters["failed"].plain = str(profile_stats["failed_checks_count"])
 
     def set_overall_result(self, result: ValidationResult):
         assert result, "Validation result must be provided"
@@ -711,6 +714,112 @@ class ValidationReportLayout(Layout):
                              f"[magenta]{result.context.target_profile.identifier}[/magenta] !!![/bold]\n",
                              style="bold red"), (1, 1)))
 
+    @staticmethod
+    def __group_issues__(result: ValidationResult) -> tuple[dict, dict]:
+        """
+        Group the failed checks by requirement and the issues by check
+        with a single pass over the issues
+        """
+        failed_checks_by_requirement = {}
+        for issue in result.issues:
+            failed_checks_by_requirement.setdefault(issue.check.requirement, set()).add(issue.check)
+        # issues are kept sorted by the validation result
+        # and all the issues of a check share its severity:
+        # so, the issues of each check need no further sorting
+        issues_by_check = {}
+        for issue in result.get_issues():
+            issues_by_check.setdefault(issue.check, []).append(issue)
+        return failed_checks_by_requirement, issues_by_check
+
+    @staticmethod
+    def __format_violation_path__(issue, markup: bool = True) -> str:
+        """
+        Format the path (result path, value and focus node) of the violation of an issue,
+        with or without the Rich markup
+        """
+        def __style__(text: str, style: str) -> str:
+            return f"[{style}]{text}[/{style}]" if markup else text
+
+        path = ""
+        if issue.resultPath and issue.value:
+            path = f" of {__style__(issue.resultPath, 'yellow')}"
+        if issue.value:
+            if issue.resultPath:
+                path += "="
+            path += f"\"{__style__(issue.value, 'green')}\" "  # keep the ending space
+        if issue.focusNode:
+            path = f"{path} on {__style__(f'<{issue.focusNode}>', 'cyan')}"
+        return path
+
+    def write_text_report(self, stream, width: Optional[int] = None, with_details: bool = False):
+        """
+        Write the validation report as plain text to the given stream,
+        without rendering the Rich layout
+        """
+        if not self.result:
+            raise ValueError("Validation result is not available")
+
+        settings = self.validation_settings
+        stats = self.profile_stats
+        result = self.result
+        write = stream.write
+
+        def __wrap__(text: str, indent: int) -> str:
+            # indent (and wrap) each line of the text separately,
+            # without splitting identifiers and URLs
+            prefix = " " * indent
+            lines = []
+            for line in str(text or "").splitlines() or [""]:
+                line = line.strip()
+                if not line or not width or width <= indent:
+                    lines.append(f"{prefix}{line}" if line else "")
+                else:
+                    lines.append(textwrap.fill(line, width=width, initial_indent=prefix, subsequent_indent=prefix,
+                                               break_on_hyphens=False, break_long_words=False))
+            return "\n".join(lines)
+
+        # Write the base info and the statistics of the validation
+        check_count_by_severity = stats["check_count_by_severity"]
+        write("- Validation Report -\n\n")
+        write(f"RO-Crate: {URI(settings['data_path']).uri}\n")
+        write(f"Target Profile: {settings['profile_identifier']}"
+              f"{' (autodetected)' if settings['profile_autodetected'] else ''}\n")
+        write(f"Validation Severity: {settings['requirement_severity']}\n\n")
+        write("Requirements Checks Validation:\n")
+        write(f"  Severity REQUIRED: {check_count_by_severity[Severity.REQUIRED]}\n")
+        write(f"  Severity RECOMMENDED: {check_count_by_severity[Severity.RECOMMENDED]}\n")
+        write(f"  Severity OPTIONAL: {check_count_by_severity[Severity.OPTIONAL]}\n")
+        write(f"  PASSED Checks: {stats['passed_checks_count']}\n")
+        write(f"  FAILED Checks: {stats['failed_checks_count']}\n\n")
+
+        # Write the overall result
+        target_profile = result.context.target_profile.identifier
+        if result.passed():
+            write(f"[OK] RO-Crate is a valid {target_profile} !!!\n")
+        else:
+            write(f"[FAILED] RO-Crate is not a valid {target_profile} !!!\n")
+
+        if not with_details:
+            return
+
+        # Write the validation details
+        failed_checks_by_requirement, issues_by_check = self.__group_issues__(result)
+        write("\nThe following requirements have not meet:\n")
+        for requirement in sorted(failed_checks_by_requirement, key=lambda x: x.identifier):
+            write(f"\n[profile: {requirement.profile.name}]\n")
+            write(f"  [ {requirement.identifier} ]: {requirement.name}\n\n")
+            write(f"{__wrap__(requirement.description, 4)}\n\n")
+            write("    Failed checks:\n\n")
+            for check in sorted(failed_checks_by_requirement[requirement],
+                                key=lambda x: (-x.severity.value, x)):
+                write(f"    [{check.relative_identifier.center(16)}]  {check.name}:\n")
+                write(f"{__wrap__(check.description, 6)}\n")
+                write("      Detected issues:\n")
+                for issue in issues_by_check.get(check, []):
+                    path = self.__format_violation_path__(issue, markup=False)
+                    write(f"{__wrap__(f'- [Violation{path}]: {issue.message}', 6)}\n")
+                write("\n")
+
     def show_validation_details(self, pager: Pager, enable_pager: bool = True):
         """
         Print the validation result
@@ -724,24 +833,27 @@ class ValidationReportLayout(Layout):
 
         logger.debug("Validation failed: %s", result.failed_requirements)
 
+        # Group the failed checks by requirement and the issues by check
+        failed_checks_by_requirement, issues_by_check = self.__group_issues__(result)
+
         # Print validation details
         with console.pager(pager=pager, styles=not console.no_color) if enable_pager else console:
             # Print the list of failed requirements
             console.print(
                 Padding("\n[bold]The following requirements have not meet: [/bold]", (0, 2)), style="white")
-            for requirement in sorted(result.failed_requirements, key=lambda x: x.identifier):
+            for requirement in sorted(failed_checks_by_requirement, key=lambda x: x.identifier):
                 console.print(
                     Align(f"\n[profile: [magenta bold]{requirement.profile.name }[/magenta bold]]", align="right")
                 )
                 console.print(
                     Padding(
                         f"[bold][cyan][u][ {requirement.identifier} ]: "
-                        f"{Markdown(requirement.name).markup}[/u][/cyan][/bold]", (0, 5)), style="white")
-                console.print(Padding(Markdown(requirement.description), (1, 6)))
+                        f"{requirement.name}[/u][/cyan][/bold]", (0, 5)), style="white")
+                console.print(Padding(__get_markdown__(requirement.description), (1, 6)))
                 console.print(Padding("[white bold u]  Failed checks  [/white bold u]\n",
                                       (0, 8)), style="white bold")
 
-                for check in sorted(result.get_failed_checks_by_requirement(requirement),
+                for check in sorted(failed_checks_by_requirement[requirement],
                                     key=lambda x: (-x.severity.value, x)):
                     issue_color = get_severity_color(check.level.severity)
                     console.print(
@@ -749,51 +861,49 @@ class ValidationReportLayout(Layout):
                             f"[bold][{issue_color}][{check.relative_identifier.center(16)}][/{issue_color}]  "
                             f"[magenta]{check.name}[/magenta][/bold]:", (0, 7)),
                         style="white bold")
-                    console.print(Padding(Markdown(check.description), (0, 27)))
+                    console.print(Padding(__get_markdown__(check.description), (0, 27)))
                     console.print(Padding("[u] Detected issues [/u]", (0, 8)), style="white bold")
-                    for issue in sorted(result.get_issues_by_check(check),
-                                        key=lambda x: (-x.severity.value, x)):
-                        path = ""
-                        if issue.resultPath and issue.value:
-                            path = f" of [yellow]{issue.resultPath}[/yellow]"
-                        if issue.value:
-                            if issue.resultPath:
-                                path += "="
-                            path += f"\"[green]{issue.value}[/green]\" "  # keep the ending space
-                        if issue.focusNode:
-                            path = f"{path} on [cyan]<{issue.focusNode}>[/cyan]"
+                    for issue in issues_by_check.get(check, []):
+                        path = self.__format_violation_path__(issue)
                         console.print(
                             Padding(f"- [[red]Violation[/red]{path}]: "
-                                    f"{Markdown(issue.message).markup}", (0, 9)), style="white")
+                                    f"{issue.message}", (0, 9)), style="white")
                     console.print("\n", style="white")
 
 
-def __compute_profile_stats__(validation_settings: dict):
+def __compute_profile_stats__(validation_settings: dict,
+                              available_profiles: Optional[list[Profile]] = None):
     """
-    Compute the statistics of the profile
+    Compute the statistics of the profile.
+    The profiles already loaded by the caller (if any) are reused
+    to avoid parsing the profiles directory again.
     """
     # extract the validation settings
-    severity_validation = Severity.get(validation_settings.get("requirement_severity"))
-    profiles = services.get_profiles(validation_settings.get("profiles_path"), severity=severity_validation)
+    severity_validation = _SEVERITY_BY_NAME[validation_settings.get("requirement_severity").upper()]
     profile = services.get_profile(validation_settings.get("profiles_path"),
                                    validation_settings.get("profile_identifier"),
-                                   severity=severity_validation)
+                                   severity=severity_validation,
+                                   profiles=available_profiles)
     # initialize the profiles list
     profiles = [profile]
 
-    # add inherited profiles if enabled
+    # add inherited profiles if enabled,
+    # skipping the ones reachable through more than one path of the inheritance graph
     if validation_settings.get("inherit_profiles"):
-        profiles.extend(profile.inherited_profiles)
+        identifiers = {profile.identifier}
+        for inherited_profile in profile.inherited_profiles:
+            if inherited_profile.identifier not in identifiers:
+                identifiers.add(inherited_profile.identifier)
+                profiles.append(inherited_profile)
     logger.debug("Inherited profiles: %r", profile.inherited_profiles)
 
     # Initialize the counters
     total_requirements = 0
     total_checks = 0
-    check_count_by_severity = {}
+    check_count_by_severity = defaultdict(int)
 
-    # Initialize the counters
-    for severity in (Severity.REQUIRED, Severity.RECOMMENDED, Severity.OPTIONAL):
-        check_count_by_severity[severity] = 0
+    # compare the plain severity values in the loop below
+    min_severity_value = severity_validation.value
 
     # Process the requirements and checks
     processed_requirements = []
@@ -803,25 +913,21 @@ def __compute_profile_stats__(validation_settings: dict):
             if requirement.hidden:
                 continue
 
+            # count the checks of the requirement by severity in a single pass
             requirement_checks_count = 0
-            for severity in (Severity.REQUIRED, Severity.RECOMMENDED, Severity.OPTIONAL):
-                logger.debug(
-                    f"Checking requirement: {requirement} severity: {severity} {severity < severity_validation}")
-                # skip requirements with lower severity
-                if severity < severity_validation:
+            for check in requirement.get_checks():
+                severity = check.level.severity
+                # skip checks with lower severity and overridden checks
+                if severity.value < min_severity_value or check.overridden:
                     continue
-                # count the checks
-                num_checks = len(
-                    [_ for _ in requirement.get_checks_by_level(LevelCollection.get(severity.name))
-                     if not _.overridden])
-                check_count_by_severity[severity] += num_checks
-                requirement_checks_count += num_checks
+                check_count_by_severity[severity] += 1
+                requirement_checks_count += 1
 
             # count the requirements and checks
             if requirement_checks_count == 0:
-                logger.debug(f"No checks for requirement: {requirement}")
+                logger.debug("No checks for requirement: %s", requirement)
             else:
-                logger.debug(f"Requirement: {requirement} checks count: {requirement_checks_count}")
+                logger.debug("Requirement: %s checks count: %s", requirement, requirement_checks_count)
                 assert not requirement.hidden, "Hidden requirements should not be counted"
                 total_requirements += 1
                 total_checks += requirement_checks_count
@@ -837,10 +943,10 @@ def __compute_profile_stats__(validation_settings: dict):
         "check_count_by_severity": check_count_by_severity,
         "total_requirements": total_requirements,
         "total_checks": total_checks,
-        "failed_requirements": [],
-        "failed_checks": [],
-        "passed_requirements": [],
-        "passed_checks": []
+        "failed_requirements_count": 0,
+        "failed_checks_count": 0,
+        "passed_requirements_count": 0,
+        "passed_checks_count": 0
     }
     logger.debug(result)
     return result
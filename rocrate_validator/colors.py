@@ -17,6 +17,15 @@ from typing import Union
 from .models import LevelCollection, Severity
 
 
+# map each severity (and its name) to its color
+__SEVERITY_COLORS__ = {
+    Severity.REQUIRED: "red",
+    Severity.RECOMMENDED: "orange1",
+    Severity.OPTIONAL: "yellow",
+}
+__SEVERITY_COLORS__.update({severity.name: color for severity, color in __SEVERITY_COLORS__.items()})
+
+
 def get_severity_color(severity: Union[str, Severity]) -> str:
     """
     Get the color for the severity
@@ -24,14 +33,7 @@ def get_severity_color(severity: Union[str, Severity]) -> str:
     :param severity: The severity
     :return: The color
     """
-    if severity == Severity.REQUIRED or severity == "REQUIRED":
-        return "red"
-    elif severity == Severity.RECOMMENDED or severity == "RECOMMENDED":
-        return "orange1"
-    elif severity == Severity.OPTIONAL or severity == "OPTIONAL":
-        return "yellow"
-    else:
-        return "white"
+    return __SEVERITY_COLORS__.get(severity, "white")
 
 
 def get_req_level_color(level: LevelCollection) -> str:
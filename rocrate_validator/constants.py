@@ -14,6 +14,7 @@
 
 # Define allowed RDF extensions and serialization formats as map
 import typing
+from types import MappingProxyType
 
 from rdflib import Namespace
 
@@ -56,8 +57,8 @@ PROFILE_FILE_EXTENSIONS = [".ttl", ".py"]
 # Define the default ontology file name
 DEFAULT_ONTOLOGY_FILE = "ontology.ttl"
 
-# Define allowed RDF extensions and serialization formats as map
-RDF_SERIALIZATION_FILE_FORMAT_MAP = {
+# Define allowed RDF extensions and serialization formats as (read-only) map
+RDF_SERIALIZATION_FILE_FORMAT_MAP = MappingProxyType({
     "xml": "xml",
     "pretty-xml": "pretty-xml",
     "trig": "trig",
@@ -65,13 +66,13 @@ RDF_SERIALIZATION_FILE_FORMAT_MAP = {
     "turtle": "ttl",
     "nt": "nt",
     "json-ld": "json-ld"
-}
+})
 
 # Define allowed RDF serialization formats
 RDF_SERIALIZATION_FORMATS_TYPES = typing.Literal[
     "xml", "pretty-xml", "trig", "n3", "turtle", "nt", "json-ld"
 ]
-RDF_SERIALIZATION_FORMATS = typing.get_args(RDF_SERIALIZATION_FORMATS_TYPES)
+RDF_SERIALIZATION_FORMATS = frozenset(typing.get_args(RDF_SERIALIZATION_FORMATS_TYPES))
 
 # Define allowed inference options
 VALID_INFERENCE_OPTIONS_TYPES = typing.Literal["owlrl", "rdfs", "both", None]
@@ -216,7 +216,9 @@ class LoggerProxy:
             _releaseLock()
 
     def __getattr__(self, name):
-        self._initialize()
+        # acquire the lock only until the logger instance is created
+        if self._instance is None:
+            self._initialize()
         return getattr(self._instance, name)
 
 
@@ -1249,6 +1249,14 @@ class ValidationResult:
                 f.write(result)
         return result
 
+    def write_json(self, path: Path) -> None:
+        """
+        Stream the JSON serialization of the validation result to the given file
+        (without building the whole JSON document in memory)
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4, cls=CustomEncoder)
+
 
 class CustomEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -1409,20 +1417,21 @@ class Validator(Publisher):
     def validation_settings(self) -> ValidationSettings:
         return self._validation_settings
 
-    def detect_rocrate_profiles(self) -> list[Profile]:
+    def detect_rocrate_profiles(self, profiles: Optional[list[Profile]] = None) -> list[Profile]:
         """
         Detect the profiles to validate against
+        (searching the given list of already loaded profiles, if any)
         """
         try:
             # initialize the validation context
             context = ValidationContext(self, self.validation_settings.to_dict())
             candidate_profiles_uris = set()
             try:
-                candidate_profiles_uris.add(context.ro_crate.metadata.get_conforms_to())
+                candidate_profiles_uris.update(context.ro_crate.metadata.get_conforms_to() or [])
             except Exception as e:
                 logger.debug("Error while getting candidate profiles URIs: %s", e)
             try:
-                candidate_profiles_uris.add(context.ro_crate.metadata.get_root_data_entity_conforms_to())
+                candidate_profiles_uris.update(context.ro_crate.metadata.get_root_data_entity_conforms_to() or [])
             except Exception as e:
                 logger.debug("Error while getting candidate profiles URIs: %s", e)
 
@@ -1430,11 +1439,12 @@ class Validator(Publisher):
             if not candidate_profiles_uris:
                 logger.debug("Unable to determine the profile to validate against")
                 return None
-            # load the profiles
-            profiles = []
+            # load the profiles (unless already loaded by the caller)
+            available_profiles = profiles
+            if available_profiles is None:
+                available_profiles = Profile.load_profiles(context.profiles_path, publicID=context.publicID,
+                                                           severity=context.requirement_severity)
             candidate_profiles = []
-            available_profiles = Profile.load_profiles(context.profiles_path, publicID=context.publicID,
-                                                       severity=context.requirement_severity)
             profiles = [p for p in available_profiles if p.uri in candidate_profiles_uris]
             # get the candidate profiles
             for profile in profiles:
@@ -1549,6 +1559,10 @@ class ValidationContext:
     def settings(self) -> dict[str, object]:
         return self._settings
 
+    @property
+    def properties(self) -> dict[str, object]:
+        return self._properties
+
     @property
     def publicID(self) -> str:
         path = str(self.ro_crate.uri.base_uri)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from typing import Any
+
 import rocrate_validator.log as logging
 from rocrate_validator.models import ValidationContext
 from rocrate_validator.requirements.python import (PyFunctionCheck, check,
@@ -21,17 +22,36 @@ from rocrate_validator.requirements.python import (PyFunctionCheck, check,
 # set up logging
 logger = logging.getLogger(__name__)
 
+# properties required for every entity of the file descriptor
+REQUIRED_ENTITY_PROPERTIES = frozenset(("@id", "@type"))
+
+# template of the error reported for the file descriptor entities missing a property
+MISSING_ENTITY_PROPERTY_MESSAGE = \
+    'Entity "{name}" of RO-Crate "{fd_path}" file descriptor does not contain the {property_name} attribute'
+
 
 @requirement(name="File Descriptor existence")
 class FileDescriptorExistence(PyFunctionCheck):
     """The file descriptor MUST be present in the RO-Crate and MUST not be empty."""
 
+    @staticmethod
+    def __has_descriptor__(context: ValidationContext) -> bool:
+        """
+        Check if the file descriptor is present in the RO-Crate,
+        probing the RO-Crate only once per validation context
+        """
+        has_descriptor = context.properties.get("file_descriptor_exists")
+        if has_descriptor is None:
+            has_descriptor = context.ro_crate.has_descriptor()
+            context.properties["file_descriptor_exists"] = has_descriptor
+        return has_descriptor
+
     @check(name="File Descriptor Existence")
     def test_existence(self, context: ValidationContext) -> bool:
         """
         Check if the file descriptor is present in the RO-Crate
         """
-        if not context.ro_crate.has_descriptor():
+        if not self.__has_descriptor__(context):
             message = f'file descriptor "{context.rel_fd_path}" is not present'
             context.result.add_error(message, self)
             return False
@@ -42,10 +62,12 @@ class FileDescriptorExistence(PyFunctionCheck):
         """
         Check if the file descriptor is not empty
         """
-        if not context.ro_crate.has_descriptor():
-            message = f'file descriptor {context.rel_fd_path} is empty'
+        if not self.__has_descriptor__(context):
+            message = f'file descriptor "{context.rel_fd_path}" is not present'
             context.result.add_error(message, self)
             return False
+        # the size is computed on the content of the file descriptor,
+        # which is read once and reused to parse the metadata
         if context.ro_crate.metadata.size == 0:
             context.result.add_error(f'RO-Crate "{context.rel_fd_path}" file descriptor is empty', self)
             return False
@@ -131,19 +153,48 @@ class FileDescriptorJsonLdFormat(PyFunctionCheck):
                 logger.exception(e)
         return False
 
+    @staticmethod
+    def __find_entities_without_id_or_type__(
+            context: ValidationContext) -> tuple[list[tuple[int, dict]], list[tuple[int, dict]]]:
+        """
+        Find the entities (with their 1-based position in the @graph) without the @id property
+        and the ones without the @type property with a single pass over the @graph,
+        computed once per validation context
+        """
+        result = context.properties.get("file_descriptor_entities_without_id_or_type")
+        if result is None:
+            entities_without_id = []
+            entities_without_type = []
+            for i, entity in enumerate(context.ro_crate.metadata.as_dict()["@graph"], start=1):
+                # probe the required properties with a single call
+                missing_properties = REQUIRED_ENTITY_PROPERTIES.difference(entity)
+                if missing_properties:
+                    if "@id" in missing_properties:
+                        entities_without_id.append((i, entity))
+                    if "@type" in missing_properties:
+                        entities_without_type.append((i, entity))
+            result = (entities_without_id, entities_without_type)
+            context.properties["file_descriptor_entities_without_id_or_type"] = result
+        return result
+
+    @staticmethod
+    def __missing_property_message__(context: ValidationContext, index: int, entity: dict, property_name: str) -> str:
+        """
+        Build the error message for an entity missing the given property,
+        referring to the entity by name, @id or position (never by its whole content)
+        """
+        return MISSING_ENTITY_PROPERTY_MESSAGE.format(
+            name=entity.get("name") or entity.get("@id") or f"<entity #{index}>",
+            fd_path=context.rel_fd_path, property_name=property_name)
+
     @check(name="Validation of the @id property of the file descriptor entities")
     def check_identifiers(self, context: ValidationContext) -> bool:
         """ Check if the file descriptor entities have the @id property """
         try:
-            json_dict = context.ro_crate.metadata.as_dict()
-            for entity in json_dict["@graph"]:
-                if "@id" not in entity:
-                    context.result.add_error(
-                        f"Entity \"{entity.get('name', None) or entity}\" "
-                        f"of RO-Crate \"{context.rel_fd_path}\" "
-                        "file descriptor does not contain the @id attribute", self)
-                    return False
-            return True
+            entities, _ = self.__find_entities_without_id_or_type__(context)
+            for i, entity in entities:
+                context.result.add_error(self.__missing_property_message__(context, i, entity, "@id"), self)
+            return len(entities) == 0
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.exception(e)
@@ -153,15 +204,10 @@ class FileDescriptorJsonLdFormat(PyFunctionCheck):
     def check_types(self, context: ValidationContext) -> bool:
         """ Check if the file descriptor entities have the @type property """
         try:
-            json_dict = context.ro_crate.metadata.as_dict()
-            for entity in json_dict["@graph"]:
-                if "@type" not in entity:
-                    context.result.add_error(
-                        f"Entity \"{entity.get('name', None) or entity}\" "
-                        f"of RO-Crate \"{context.rel_fd_path}\" "
-                        "file descriptor does not contain the @type attribute", self)
-                    return False
-            return True
+            _, entities = self.__find_entities_without_id_or_type__(context)
+            for i, entity in entities:
+                context.result.add_error(self.__missing_property_message__(context, i, entity, "@type"), self)
+            return len(entities) == 0
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.exception(e)
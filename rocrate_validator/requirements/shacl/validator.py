@@ -439,7 +439,7 @@ class SHACLValidator:
                 serialization_output_format not in RDF_SERIALIZATION_FORMATS:
             raise ValueError(
                 "serialization_output_format must be one of "
-                f"{RDF_SERIALIZATION_FORMATS}")
+                f"{sorted(RDF_SERIALIZATION_FORMATS)}")
 
         assert inference in (None, "rdfs", "owlrl", "both"), "Invalid inference option"
 
@@ -19,6 +19,7 @@ import json
 import struct
 import zipfile
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Union
 
@@ -147,6 +148,13 @@ class ROCrateMetadata:
         self._ro_crate = ro_crate
         self._dict = None
         self._json: str = None
+        # the error raised loading the dictionary (if any),
+        # cached to avoid reading and parsing the file again on every access
+        self._dict_error: Optional[Exception] = None
+        # index of the entities by @id and @type, built once from the metadata dictionary
+        self._entities: Optional[list[ROCrateEntity]] = None
+        self._entities_by_id: Optional[dict[str, ROCrateEntity]] = None
+        self._entities_by_type: Optional[dict[str, list[ROCrateEntity]]] = None
 
     @property
     def ro_crate(self) -> ROCrate:
@@ -195,24 +203,42 @@ class ROCrateMetadata:
             raise ValueError("no main workflow in metadata file descriptor")
         return main_workflow
 
+    def __init_entities_index__(self):
+        """
+        Index the entities of the @graph by @id and by @type with a single pass
+        """
+        entities = []
+        entities_by_id = {}
+        entities_by_type = defaultdict(list)
+        for raw_entity in self.as_dict().get('@graph', []):
+            entity = ROCrateEntity(self, raw_entity)
+            entities.append(entity)
+            # keep the first entity with a given @id
+            entities_by_id.setdefault(raw_entity.get('@id'), entity)
+            entity_types = raw_entity.get('@type')
+            for entity_type in entity_types if isinstance(entity_types, list) else [entity_types]:
+                if isinstance(entity_type, str):
+                    entities_by_type[entity_type].append(entity)
+        self._entities = entities
+        self._entities_by_id = entities_by_id
+        self._entities_by_type = dict(entities_by_type)
+
     def get_entity(self, entity_id: str) -> ROCrateEntity:
-        for entity in self.as_dict().get('@graph', []):
-            if entity.get('@id') == entity_id:
-                return ROCrateEntity(self, entity)
-        return None
+        if self._entities_by_id is None:
+            self.__init_entities_index__()
+        return self._entities_by_id.get(entity_id)
 
     def get_entities(self) -> list[ROCrateEntity]:
-        entities = []
-        for entity in self.as_dict().get('@graph', []):
-            entities.append(ROCrateEntity(self, entity))
-        return entities
+        if self._entities is None:
+            self.__init_entities_index__()
+        return self._entities.copy()
 
     def get_entities_by_type(self, entity_type: Union[str, list[str]]) -> list[ROCrateEntity]:
-        entities = []
-        for e in self.get_entities():
-            if e.has_type(entity_type):
-                entities.append(e)
-        return entities
+        if self._entities_by_type is None:
+            self.__init_entities_index__()
+        if isinstance(entity_type, list):
+            return [e for e in self._entities if e.has_types(entity_type)]
+        return self._entities_by_type.get(entity_type, []).copy()
 
     def get_dataset_entities(self) -> list[ROCrateEntity]:
         return self.get_entities_by_type('Dataset')
@@ -243,15 +269,22 @@ class ROCrateMetadata:
             return None
 
     def as_json(self) -> str:
-        if not self._json:
+        if self._json is None:
             self._json = self.ro_crate.get_file_content(
                 Path(self.METADATA_FILE_DESCRIPTOR), binary_mode=False)
         return self._json
 
     def as_dict(self) -> dict:
-        if not self._dict:
+        if self._dict is None:
             # if the dictionary is not cached, load it
-            self._dict = json.loads(self.as_json())
+            # (only once: a failure is reported again to the subsequent callers)
+            if self._dict_error is None:
+                try:
+                    self._dict = json.loads(self.as_json())
+                except Exception as e:
+                    self._dict_error = e
+            if self._dict_error is not None:
+                raise self._dict_error
         return self._dict
 
     def as_graph(self, publicID: str = None) -> Graph:
@@ -412,9 +445,13 @@ class ROCrateLocalFolder(ROCrate):
 
     def get_file_content(self, path: Path, binary_mode: bool = True) -> Union[str, bytes]:
         path = self.__parse_path__(path)
-        if not self.has_file(path):
-            raise FileNotFoundError(f"File not found: {path}")
-        return path.read_bytes() if binary_mode else path.read_text()
+        # read the whole file at once, without probing it beforehand
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
+        return data if binary_mode else data.decode('utf-8')
 
 
 class ROCrateLocalZip(ROCrate):
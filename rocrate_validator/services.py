@@ -36,11 +36,16 @@ DEFAULT_PROFILES_PATH = get_profiles_path()
 logger = logging.getLogger(__name__)
 
 
-def detect_profiles(settings: Union[dict, ValidationSettings]) -> list[Profile]:
+def detect_profiles(settings: Union[dict, ValidationSettings],
+                    profiles: Optional[list[Profile]] = None) -> list[Profile]:
+    """
+    Detect the profiles of a RO-Crate
+    (searching the given list of already loaded profiles, if any)
+    """
     # initialize the validator
     validator = __initialise_validator__(settings)
     # detect the profiles
-    profiles = validator.detect_rocrate_profiles()
+    profiles = validator.detect_rocrate_profiles(profiles=profiles)
     logger.debug("Profiles detected: %s", profiles)
     return profiles
 
@@ -178,12 +183,15 @@ def get_profile(profiles_path: Path = DEFAULT_PROFILES_PATH,
                 publicID: str = None,
                 severity=Severity.OPTIONAL,
                 allow_requirement_check_override: bool =
-                ValidationSettings.allow_requirement_check_override) -> Profile:
+                ValidationSettings.allow_requirement_check_override,
+                profiles: Optional[list[Profile]] = None) -> Profile:
     """
     Load the profiles from the given path
+    (or search the given list of already loaded profiles)
     """
-    profiles = get_profiles(profiles_path, publicID=publicID, severity=severity,
-                            allow_requirement_check_override=allow_requirement_check_override)
+    if profiles is None:
+        profiles = get_profiles(profiles_path, publicID=publicID, severity=severity,
+                                allow_requirement_check_override=allow_requirement_check_override)
     profile = next((p for p in profiles if p.identifier == profile_identifier), None) or \
         next((p for p in profiles if str(p.identifier).replace(f"-{p.version}", '') == profile_identifier), None)
     if not profile:
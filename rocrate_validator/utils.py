@@ -472,16 +472,20 @@ def validate_rocrate_uri(uri: Union[str, URI], silent: bool = False) -> bool:
         try:
             # parse the value to extract the scheme
             uri = URI(uri) if isinstance(uri, str) else uri
-            # check if the URI is a remote resource or local directory or local file
-            if not uri.is_remote_resource() and not uri.is_local_directory() and not uri.is_local_file():
-                raise errors.ROCrateInvalidURIError(uri)
-            # check if the local file is a ZIP file
-            if uri.is_local_file() and uri.as_path().suffix != ".zip":
-                raise errors.ROCrateInvalidURIError(uri)
-            # check if the resource is available
-            if not uri.is_available():
-                raise errors.ROCrateInvalidURIError(uri, message=f"The RO-crate at the URI \"{uri}\" is not available")
-            return True
+            # check if the remote resource is available:
+            # this is the only case which requires a network request
+            if uri.is_remote_resource():
+                if not uri.is_available():
+                    raise errors.ROCrateInvalidURIError(
+                        uri, message=f"The RO-crate at the URI \"{uri}\" is not available")
+                return True
+            # a local directory is a valid RO-Crate URI
+            if uri.is_local_directory():
+                return True
+            # a local file is a valid RO-Crate URI only if it is a ZIP file
+            if uri.is_local_file() and uri.as_path().suffix == ".zip":
+                return True
+            raise errors.ROCrateInvalidURIError(uri)
         except ValueError as e:
             logger.error(e)
             if logger.isEnabledFor(logging.DEBUG):
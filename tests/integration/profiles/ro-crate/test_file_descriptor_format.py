@@ -14,7 +14,7 @@
 
 import logging
 
-from rocrate_validator import models
+from rocrate_validator import models, services
 from tests.ro_crates import InvalidFileDescriptor
 from tests.shared import do_entity_test
 
@@ -37,6 +37,26 @@ def test_missing_file_descriptor():
         )
 
 
+def test_missing_file_descriptor_existence_and_size():
+    """
+    Test a RO-Crate without a file descriptor:
+    both the existence and the size checks should report it as not present.
+    """
+    with paths.missing_file_descriptor as rocrate_path:
+        result = services.validate(models.ValidationSettings(**{
+            "data_path": rocrate_path,
+            "requirement_severity": models.Severity.REQUIRED,
+            "abort_on_first": False
+        }))
+        assert not result.passed(), "RO-Crate should be invalid"
+
+        for check_name in ("File Descriptor Existence", "File Descriptor size check"):
+            messages = [issue.message for issue in result.get_issues(models.Severity.REQUIRED)
+                        if issue.check.name == check_name]
+            assert messages == ['file descriptor "ro-crate-metadata.json" is not present'], \
+                f"The check \"{check_name}\" should report the missing file descriptor"
+
+
 def test_not_valid_json_format():
     """Test a RO-Crate with an invalid JSON file descriptor format."""
     do_entity_test(
@@ -98,3 +118,37 @@ def test_not_valid_jsonld_format_missing_types():
         ["File Descriptor JSON-LD format"],
         ["file descriptor does not contain the @type attribute"]
     )
+
+
+def test_not_valid_jsonld_format_missing_ids_and_types():
+    """
+    Test a RO-Crate with an invalid JSON-LD file descriptor format.
+    Several entities in the file descriptor do not contain the @id or the @type attribute:
+    an issue is expected for each of them.
+    """
+    result = services.validate(models.ValidationSettings(**{
+        "data_path": f"{paths.invalid_jsonld_format}/missing_ids_and_types",
+        "requirement_severity": models.Severity.REQUIRED,
+        "abort_on_first": False
+    }))
+    assert not result.passed(), "RO-Crate should be invalid"
+
+    def get_issue_messages(check_name: str) -> list[str]:
+        return sorted(issue.message for issue in result.get_issues(models.Severity.REQUIRED)
+                      if issue.check.name == check_name)
+
+    # one issue for each entity without @id, referred by name or by (1-based) position
+    assert get_issue_messages("Validation of the @id property of the file descriptor entities") == [
+        'Entity "<entity #4>" of RO-Crate "ro-crate-metadata.json" '
+        'file descriptor does not contain the @id attribute',
+        'Entity "File without id" of RO-Crate "ro-crate-metadata.json" '
+        'file descriptor does not contain the @id attribute',
+    ]
+
+    # one issue for each entity without @type, referred by name or by @id
+    assert get_issue_messages("Validation of the @type property of the file descriptor entities") == [
+        'Entity "README" of RO-Crate "ro-crate-metadata.json" '
+        'file descriptor does not contain the @type attribute',
+        'Entity "data.csv" of RO-Crate "ro-crate-metadata.json" '
+        'file descriptor does not contain the @type attribute',
+    ]
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import re
 
 from click.testing import CliRunner
@@ -50,6 +51,13 @@ def test_validate_subcmd_valid_local_folder_rocrate(cli_runner: CliRunner):
     assert re.search(r'RO-Crate.*is a valid', result.output)
 
 
+def test_validate_subcmd_autodetected_profile(cli_runner: CliRunner):
+    result = cli_runner.invoke(cli, ['validate', str(ValidROC().workflow_roc), '--verbose', '--no-paging'])
+    assert result.exit_code == 0
+    assert re.search(r'Target Profile:\s*workflow-ro-crate-1\.0\s*\(autodetected\)', result.output)
+    assert re.search(r'RO-Crate.*is a valid.*workflow-ro-crate-1\.0', result.output)
+
+
 def test_validate_subcmd_valid_remote_rocrate(cli_runner: CliRunner):
     result = cli_runner.invoke(
         cli, ['validate', str(ValidROC().sort_and_change_remote), '--verbose', '--no-paging'])
@@ -61,3 +69,33 @@ def test_validate_subcmd_invalid_local_archive_rocrate(cli_runner: CliRunner):
     result = cli_runner.invoke(cli, ['validate', str(ValidROC().sort_and_change_archive), '--verbose', '--no-paging'])
     assert result.exit_code == 0
     assert re.search(r'RO-Crate.*is a valid', result.output)
+
+
+def test_validate_subcmd_invalid_rocrate_text_report_file(cli_runner: CliRunner, tmp_path):
+    output_file = tmp_path / "report.txt"
+    result = cli_runner.invoke(cli, ['validate', str(
+        InvalidFileDescriptor().invalid_json_format), '--verbose', '--no-paging', '-p', 'ro-crate',
+        '--output-format', 'text', '--output-file', str(output_file), '--output-line-width', '60'])
+    assert result.exit_code == 1
+    report = output_file.read_text()
+    assert re.search(r'\[FAILED\] RO-Crate is not a valid ro-crate', report)
+    assert "File Descriptor JSON format" in report
+    # identifiers are not split when the lines are wrapped
+    assert 'file descriptor "ro-crate-metadata.json" is not in the correct format' \
+        in " ".join(line.strip() for line in report.splitlines())
+    # every wrapped line of the details keeps its indentation
+    details = report.split("The following requirements have not meet:")[1]
+    assert all(not line or line.startswith(" ") or line.startswith("[profile:")
+               for line in details.splitlines())
+
+
+def test_validate_subcmd_invalid_rocrate_json_report_file(cli_runner: CliRunner, tmp_path):
+    output_file = tmp_path / "report.json"
+    result = cli_runner.invoke(cli, ['validate', str(
+        InvalidFileDescriptor().invalid_json_format), '--no-paging', '-p', 'ro-crate',
+        '--output-format', 'json', '--output-file', str(output_file)])
+    assert result.exit_code == 1
+    report = json.loads(output_file.read_text())
+    assert report["passed"] is False
+    assert report["validation_settings"]["profile_identifier"].startswith("ro-crate")
+    assert any("is not in the correct format" in issue["message"] for issue in report["issues"])
@@ -12,11 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import _thread
+import io
 import os
+import threading
+import time
+from collections import defaultdict
 
+import pytest
 
 from rocrate_validator import log as logging
-from rocrate_validator.cli.commands.validate import __compute_profile_stats__
+from rocrate_validator.cli.commands.validate import (ValidationReportLayout,
+                                                     __compute_profile_stats__)
+from rocrate_validator.cli.utils import Console
 from rocrate_validator.models import DEFAULT_PROFILES_PATH, LevelCollection, Profile
 
 # set up logging
@@ -77,3 +85,48 @@ def test_compute_stats(fake_profiles_path):
     assert stats["total_checks"] == len([_ for _ in requirements[0].get_checks() if not _.overridden])
 
     logger.error(stats)
+
+
+def new_report_layout() -> ValidationReportLayout:
+    settings = {
+        "data_path": "/path/to/rocrate",
+        "profile_identifier": "a",
+        "profile_autodetected": False,
+        "requirement_severity": "REQUIRED",
+    }
+    stats = {
+        "profiles": [],
+        "check_count_by_severity": defaultdict(int),
+        "total_requirements": 0,
+        "total_checks": 0,
+        "passed_checks_count": 0,
+        "failed_checks_count": 0,
+    }
+    return ValidationReportLayout(Console(file=io.StringIO()), settings, stats, None)
+
+
+def test_live_validation_result():
+    # the result of the validation is returned by live
+    assert new_report_layout().live(lambda: "result") == "result"
+
+    # and its errors are raised again
+    def fail():
+        raise ValueError("error")
+
+    with pytest.raises(ValueError):
+        new_report_layout().live(fail)
+
+
+def test_live_validation_interrupt():
+    # interrupt the main thread while a (long) validation is running
+    timer = threading.Timer(0.5, _thread.interrupt_main)
+    timer.start()
+    start = time.monotonic()
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            new_report_layout().live(lambda: time.sleep(10))
+    finally:
+        timer.cancel()
+
+    # the interrupt is not delayed until the end of the validation
+    assert time.monotonic() - start < 5
@@ -25,7 +25,7 @@ from rocrate_validator.rocrate import (
     ROCrateMetadata,
     ROCrateRemoteZip,
 )
-from tests.ro_crates import ValidROC
+from tests.ro_crates import InvalidFileDescriptor, ValidROC
 
 # set up logging
 logger = logging.getLogger(__name__)
@@ -101,6 +101,34 @@ def test_valid_local_rocrate():
     assert root_data_entity.is_available(), "Main entity should be available"
 
 
+def test_metadata_entities_index():
+    metadata = ROCrateLocalFolder(ValidROC().wrroc_paper).metadata
+
+    # the entities looked up by @id and by @type are the ones of the @graph
+    entities = metadata.get_entities()
+    assert len(entities) == len(metadata.as_dict()["@graph"]), "Should index all the entities"
+    for entity in entities:
+        assert metadata.get_entity(entity.id) is entity, "Should find the entity by @id"
+    assert metadata.get_entity("does-not-exist") is None, "Should not find unknown entities"
+
+    datasets = metadata.get_entities_by_type("Dataset")
+    assert datasets == [e for e in entities if e.has_type("Dataset")], "Should find the entities by @type"
+
+
+def test_invalid_json_metadata_parsed_once():
+    roc = ROCrateLocalFolder(InvalidFileDescriptor().invalid_json_format)
+    metadata = roc.metadata
+
+    # the parsing error is raised on the first access
+    with pytest.raises(ValueError) as first_error:
+        metadata.as_dict()
+
+    # and the same error is raised again without parsing the file again
+    with pytest.raises(ValueError) as second_error:
+        metadata.as_dict()
+    assert first_error.value is second_error.value, "The parsing error should be cached"
+
+
 ################################
 #      ROCrateLocalZip
 ################################
@@ -0,0 +1,74 @@
+# Copyright (c) 2024 CRS4
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from rocrate_validator import services
+from rocrate_validator.models import DEFAULT_PROFILES_PATH, Profile, Severity
+from tests.ro_crates import InvalidFileDescriptor, ValidROC
+
+
+def test_detect_profiles():
+    profiles = services.detect_profiles(settings={
+        "data_path": ValidROC().workflow_roc,
+        "requirement_severity": Severity.REQUIRED
+    })
+    assert profiles is not None, "Profiles should be detected"
+    assert [p.identifier for p in profiles] == ["workflow-ro-crate-1.0"], \
+        "The workflow-ro-crate profile should be detected"
+
+
+def test_detect_profiles_with_loaded_profiles(monkeypatch):
+    settings = {
+        "data_path": ValidROC().workflow_roc,
+        "requirement_severity": Severity.REQUIRED
+    }
+    detected_profiles = services.detect_profiles(settings=settings)
+
+    # count the profiles loaded from now on
+    load_profiles = Profile.load_profiles
+    loads = []
+
+    def counting_load_profiles(*args, **kwargs):
+        loads.append(args)
+        return load_profiles(*args, **kwargs)
+
+    monkeypatch.setattr(Profile, "load_profiles", counting_load_profiles)
+
+    # the profiles detected among the given ones are the same,
+    # and the profiles are not loaded again
+    available_profiles = load_profiles(DEFAULT_PROFILES_PATH, severity=Severity.REQUIRED)
+    profiles = services.detect_profiles(settings=settings, profiles=available_profiles)
+    assert [p.identifier for p in profiles or []] == [p.identifier for p in detected_profiles or []], \
+        "The same profiles should be detected"
+    assert all(any(p is _ for _ in available_profiles) for p in profiles or []), \
+        "The detected profiles should be taken from the given list"
+    assert not loads, "The profiles should not be loaded again"
+
+
+def test_validation_result_json_serialization(tmp_path):
+    result = services.validate({
+        "data_path": InvalidFileDescriptor().invalid_json_format,
+        "profile_identifier": "ro-crate",
+        "requirement_severity": Severity.REQUIRED
+    })
+    json_result = result.to_json()
+
+    # to_json returns the JSON document even when it also writes it to a file
+    json_path = tmp_path / "to_json.json"
+    assert result.to_json(path=json_path) == json_result
+    assert json_path.read_text() == json_result
+
+    # write_json streams the same JSON document to the file
+    stream_path = tmp_path / "write_json.json"
+    assert result.write_json(stream_path) is None
+    assert stream_path.read_text() == json_result